@@ -57,4 +57,9 @@ class LogEntryAdmin(admin.ModelAdmin, LogEntryAdminMixin):
 
     def get_queryset(self, request):
         self.request = request
-        return super().get_queryset(request=request)
+        # list_select_related only covers the changelist; the change and history views need this too.
+        return (
+            super()
+            .get_queryset(request=request)
+            .select_related("content_type", "actor")
+        )
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # AddIndex locks the table against writes while the index is built. On a
+    # large table, create the index CONCURRENTLY by hand and fake this
+    # migration instead; see docs/source/upgrade.rst.
+
+    dependencies = [
+        ("auditlog", "0016_logentry_remote_port"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="logentry",
+            index=models.Index(
+                fields=["content_type", "object_pk", "-timestamp"],
+                name="auditlog_ct_objpk_ts_idx",
+            ),
+        ),
+    ]
@@ -160,13 +160,17 @@ class LogEntryManager(models.Manager):
         :return: The LogEntry objects for the objects in the given queryset.
         :rtype: QuerySet
         """
-        if not isinstance(queryset, QuerySet) or queryset.count() == 0:
+        if not isinstance(queryset, QuerySet):
             return self.none()
 
-        content_type = ContentType.objects.get_for_model(queryset.model)
+        # Materialize the primary keys once; an empty list short-circuits to none().
         primary_keys = list(
             queryset.values_list(queryset.model._meta.pk.name, flat=True)
         )
+        if not primary_keys:
+            return self.none()
+
+        content_type = ContentType.objects.get_for_model(queryset.model)
 
         if isinstance(primary_keys[0], int):
             return (
@@ -392,6 +396,13 @@ class LogEntry(models.Model):
         ordering = ["-timestamp"]
         verbose_name = _("log entry")
         verbose_name_plural = _("log entries")
+        indexes = [
+            # Serve an object's history newest-first, e.g. ``obj.history.latest()``.
+            models.Index(
+                fields=["content_type", "object_pk", "-timestamp"],
+                name="auditlog_ct_objpk_ts_idx",
+            ),
+        ]
 
     def __str__(self):
         if self.action == self.Action.CREATE:
@@ -112,6 +112,8 @@ class AuditlogFlushTest(TestCase):
         self.assertEqual(err, "", msg="No stderr")
 
 
+# TRUNCATE commits implicitly on some backends (e.g. MySQL, Oracle), so these
+# tests cannot run inside TestCase's wrapping transaction.
 class AuditlogFlushWithTruncateTest(TransactionTestCase):
     def setUp(self):
         input_patcher = mock.patch("builtins.input")
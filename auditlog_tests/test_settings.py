@@ -37,9 +37,14 @@ DATABASES = {
         "PASSWORD": os.getenv("TEST_DB_PASS", ""),
         "HOST": os.getenv("TEST_DB_HOST", "127.0.0.1"),
         "PORT": os.getenv("TEST_DB_PORT", "5432"),
+        # The test database is disposable; don't wait for WAL flushes on commit.
+        "OPTIONS": {"options": "-c synchronous_commit=off"},
     }
 }
 
+# Password hashing is not under test; use a fast hasher for test users.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 TEMPLATES = [
     {
         "APP_DIRS": True,
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import itertools
 import json
@@ -20,7 +21,7 @@ from django.db import models
 from django.db.models import JSONField, Value
 from django.db.models.functions import Now
 from django.db.models.signals import pre_save
-from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import resolve, reverse
 from django.utils import dateformat, formats
 from django.utils import timezone as django_timezone
@@ -68,12 +69,18 @@ from auditlog_tests.models import (
 )
 
 
+def setUpModule():
+    # Fill the content type cache in one query instead of one per model.
+    ContentType.objects.get_for_models(*apps.get_models())
+
+
 class SimpleModelTest(TestCase):
-    def setUp(self):
-        self.obj = self.make_object()
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = cls.make_object()
 
-    def make_object(self):
+    @classmethod
+    def make_object(cls):
         return SimpleModel.objects.create(text="I am not difficult.")
 
     def test_create(self):
@@ -82,9 +89,10 @@ class SimpleModelTest(TestCase):
         obj = self.obj
 
         # Check for log entries
-        self.assertEqual(obj.history.count(), 1, msg="There is one log entry")
+        entries = list(obj.history.all())
+        self.assertEqual(len(entries), 1, msg="There is one log entry")
 
-        history = obj.history.get()
+        history = entries[0]
         self.check_create_log_entry(obj, history)
 
     def check_create_log_entry(self, obj, history):
@@ -102,13 +110,10 @@ class SimpleModelTest(TestCase):
         self.update(obj)
 
         # Check for log entries
-        self.assertEqual(
-            obj.history.filter(action=LogEntry.Action.UPDATE).count(),
-            1,
-            msg="There is one log entry for 'UPDATE'",
-        )
+        entries = list(obj.history.filter(action=LogEntry.Action.UPDATE))
+        self.assertEqual(len(entries), 1, msg="There is one log entry for 'UPDATE'")
 
-        history = obj.history.get(action=LogEntry.Action.UPDATE)
+        history = entries[0]
         self.check_update_log_entry(obj, history)
 
     def update(self, obj):
@@ -157,8 +162,8 @@ class SimpleModelTest(TestCase):
             0,
             msg="There is no log entries created",
         )
-        obj.refresh_from_db()
-        self.assertFalse(obj.boolean)  # Change didn't persist in DB as expected.
+        # Change didn't persist in DB as expected.
+        self.assertTrue(type(obj).objects.filter(pk=obj.pk, boolean=False).exists())
 
         # Passing `None` should save both fields according to Django.
         obj.integer = 1
@@ -174,14 +179,13 @@ class SimpleModelTest(TestCase):
         """Deletion is logged correctly."""
         # Get the object to work with
         obj = self.obj
-        content_type = ContentType.objects.get_for_model(obj.__class__)
-        pk = obj.pk
+        # Build the lookup while the object still has its primary key.
+        qs = LogEntry.objects.get_for_object(obj)
 
         # Delete the object
         self.delete(obj)
 
         # Check for log entries
-        qs = LogEntry.objects.filter(content_type=content_type, object_pk=pk)
         self.assertEqual(qs.count(), 1, msg="There is one log entry for 'DELETE'")
 
         history = qs.get()
@@ -195,7 +199,7 @@ class SimpleModelTest(TestCase):
 
     def test_recreate(self):
         self.obj.delete()
-        self.setUp()
+        self.obj = self.make_object()
         self.test_create()
 
     def test_create_log_to_object_from_other_database(self):
@@ -217,11 +221,11 @@ class SimpleModelTest(TestCase):
         )  # must be created in default database
 
     def test_default_timestamp(self):
-        start = django_timezone.now()
-        self.test_recreate()
-        end = django_timezone.now()
+        timestamp = datetime.datetime(2022, 8, 1, 12, 0, tzinfo=timezone.utc)
+        with freezegun.freeze_time(timestamp):
+            self.test_recreate()
         history = self.obj.history.latest()
-        self.assertTrue(start <= history.timestamp <= end)
+        self.assertEqual(history.timestamp, timestamp)
 
     def test_manual_timestamp(self):
         timestamp = datetime.datetime(1999, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
@@ -250,28 +254,24 @@ class NoActorMixin:
 
 
 class WithActorMixin:
-    sequence = itertools.count()
-
-    def setUp(self):
-        username = f"actor_{next(self.sequence)}"
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        username = f"{cls.__name__}_actor"
+        cls.user = get_user_model().objects.create(
             username=username,
             email=f"{username}@example.com",
             password="secret",
         )
-        super().setUp()
+        super().setUpTestData()
 
-    def tearDown(self):
-        self.user.delete()
-        super().tearDown()
-
-    def make_object(self):
-        with set_actor(self.user):
+    @classmethod
+    def make_object(cls):
+        with set_actor(cls.user):
             return super().make_object()
 
     def check_create_log_entry(self, obj, log_entry):
         super().check_create_log_entry(obj, log_entry)
-        self.assertEqual(log_entry.actor, self.user)
+        self.assertEqual(log_entry.actor_id, self.user.pk)
 
     def update(self, obj):
         with set_actor(self.user):
@@ -279,7 +279,7 @@ class WithActorMixin:
 
     def check_update_log_entry(self, obj, log_entry):
         super().check_update_log_entry(obj, log_entry)
-        self.assertEqual(log_entry.actor, self.user)
+        self.assertEqual(log_entry.actor_id, self.user.pk)
 
     def delete(self, obj):
         with set_actor(self.user):
@@ -287,13 +287,16 @@ class WithActorMixin:
 
     def check_delete_log_entry(self, obj, log_entry):
         super().check_delete_log_entry(obj, log_entry)
-        self.assertEqual(log_entry.actor, self.user)
+        self.assertEqual(log_entry.actor_id, self.user.pk)
 
 
 class AltPrimaryKeyModelBase(SimpleModelTest):
-    def make_object(self):
+    key_sequence = itertools.count()
+
+    @classmethod
+    def make_object(cls):
         return AltPrimaryKeyModel.objects.create(
-            key=str(datetime.datetime.now()), text="I am strange."
+            key=f"altpk-{next(cls.key_sequence)}", text="I am strange."
         )
 
 
@@ -306,7 +309,8 @@ class AltPrimaryKeyModelWithActorTest(WithActorMixin, AltPrimaryKeyModelBase):
 
 
 class UUIDPrimaryKeyModelModelBase(SimpleModelTest):
-    def make_object(self):
+    @classmethod
+    def make_object(cls):
         return UUIDPrimaryKeyModel.objects.create(text="I am strange.")
 
     def test_get_for_object(self):
@@ -336,9 +340,10 @@ class UUIDPrimaryKeyModelModelWithActorTest(
 
 
 class ModelPrimaryKeyModelBase(SimpleModelTest):
-    def make_object(self):
-        self.key = super().make_object()
-        return ModelPrimaryKeyModel.objects.create(key=self.key, text="I am strange.")
+    @classmethod
+    def make_object(cls):
+        key = super().make_object()
+        return ModelPrimaryKeyModel.objects.create(key=key, text="I am strange.")
 
 
 class ModelPrimaryKeyModelTest(NoActorMixin, ModelPrimaryKeyModelBase):
@@ -349,8 +354,7 @@ class ModelPrimaryKeyModelWithActorTest(WithActorMixin, ModelPrimaryKeyModelBase
     pass
 
 
-# Must inherit from TransactionTestCase to use self.assertNumQueries.
-class ModelPrimaryKeyTest(TransactionTestCase):
+class ModelPrimaryKeyTest(TestCase):
     def test_get_pk_value(self):
         """
         Test that the primary key can be retrieved without additional database queries.
@@ -368,10 +372,15 @@ class ModelPrimaryKeyTest(TransactionTestCase):
             pk = obj.key.pk
         self.assertEqual(pk, obj.pk)
         self.assertEqual(pk, key.pk)
+        # Still no database access once the related object is loaded.
+        with self.assertNumQueries(0):
+            pk = LogEntry.objects._get_pk_value(obj)
+        self.assertEqual(pk, key.pk)
 
 
 class ProxyModelBase(SimpleModelTest):
-    def make_object(self):
+    @classmethod
+    def make_object(cls):
         return ProxyModel.objects.create(text="I am not what you think.")
 
 
@@ -388,15 +397,19 @@ class ManyRelatedModelTest(TestCase):
     Test the behaviour of many-to-many relationships.
     """
 
-    def setUp(self):
-        self.obj = ManyRelatedModel.objects.create()
-        self.recursive = ManyRelatedModel.objects.create()
-        self.related = ManyRelatedOtherModel.objects.create()
-        self.obj_reusable = ModelForReusableThroughModel.objects.create()
-        self.obj_reusable_related = ReusableThroughRelatedModel.objects.create()
-        self.base_log_entry_count = (
-            LogEntry.objects.count()
-        )  # created by the create() calls above
+    @classmethod
+    def setUpTestData(cls):
+        # test_recursive compares against this object's CREATE entry.
+        cls.recursive = ManyRelatedModel.objects.create()
+        with disable_auditlog():
+            cls.obj = ManyRelatedModel.objects.create()
+            cls.related = ManyRelatedOtherModel.objects.create()
+            cls.obj_reusable = ModelForReusableThroughModel.objects.create()
+            cls.obj_reusable_related = ReusableThroughRelatedModel.objects.create()
+        cls.base_log_entry_count = LogEntry.objects.count()
+        # Keep the content type lookup out of the assertNumQueries counts below;
+        # no actor is set, so none is looked up either.
+        ContentType.objects.get_for_model(ManyRelatedModel)
 
     def test_recursive(self):
         self.obj.recursive.add(self.recursive)
@@ -406,15 +419,34 @@ class ManyRelatedModelTest(TestCase):
         )
 
     def test_related_add_from_first_side(self):
-        self.obj.related.add(self.related)
-        self.assertEqual(
-            LogEntry.objects.get_for_objects(self.obj.related.all()).first(),
-            self.related.history.first(),
+        # Existing through rows, through INSERT, added objects,
+        # get_additional_data() and the LogEntry INSERT.
+        with self.assertNumQueries(5):
+            self.obj.related.add(self.related)
+        # Adding from this side logs the change on self.obj only.
+        self.assertFalse(
+            LogEntry.objects.get_for_objects(self.obj.related.all()).exists()
         )
         self.assertEqual(LogEntry.objects.count(), self.base_log_entry_count + 1)
 
+    def test_get_for_objects_single_query(self):
+        self.obj.related.add(self.related)
+        queryset = ManyRelatedModel.objects.filter(pk=self.obj.pk)
+        # Warm the content type cache so only the primary key lookup is counted.
+        ContentType.objects.get_for_model(ManyRelatedModel)
+        with self.assertNumQueries(1):
+            entries = LogEntry.objects.get_for_objects(queryset)
+        self.assertEqual(len(entries), 1)
+        self.assertCountEqual(entries, self.obj.history.all())
+        with self.assertNumQueries(0):
+            entries = LogEntry.objects.get_for_objects(queryset.none())
+        self.assertFalse(entries.exists())
+
     def test_related_add_from_other_side(self):
-        self.related.related.add(self.obj)
+        # Existing through rows, through INSERT, added objects and the LogEntry
+        # INSERT; get_additional_data() is not called from this side.
+        with self.assertNumQueries(4):
+            self.related.related.add(self.obj)
         self.assertEqual(
             LogEntry.objects.get_for_objects(self.obj.related.all()).first(),
             self.related.history.first(),
@@ -422,23 +454,35 @@ class ManyRelatedModelTest(TestCase):
         self.assertEqual(LogEntry.objects.count(), self.base_log_entry_count + 1)
 
     def test_related_remove_from_first_side(self):
-        self.obj.related.add(self.related)
-        self.obj.related.remove(self.related)
+        # The 5 queries of the add, then the through DELETE, removed objects,
+        # get_additional_data() and the LogEntry INSERT.
+        with self.assertNumQueries(9):
+            self.obj.related.add(self.related)
+            self.obj.related.remove(self.related)
         self.assertEqual(LogEntry.objects.count(), self.base_log_entry_count + 2)
 
     def test_related_remove_from_other_side(self):
-        self.related.related.add(self.obj)
-        self.related.related.remove(self.obj)
+        # The 4 queries of the add, then the through DELETE, removed objects
+        # and the LogEntry INSERT.
+        with self.assertNumQueries(7):
+            self.related.related.add(self.obj)
+            self.related.related.remove(self.obj)
         self.assertEqual(LogEntry.objects.count(), self.base_log_entry_count + 2)
 
     def test_related_clear_from_first_side(self):
-        self.obj.related.add(self.related)
-        self.obj.related.clear()
+        # The 5 queries of the add, then the through DELETE, cleared objects,
+        # get_additional_data() and the LogEntry INSERT.
+        with self.assertNumQueries(9):
+            self.obj.related.add(self.related)
+            self.obj.related.clear()
         self.assertEqual(LogEntry.objects.count(), self.base_log_entry_count + 2)
 
     def test_related_clear_from_other_side(self):
-        self.related.related.add(self.obj)
-        self.related.related.clear()
+        # The 4 queries of the add, then the through DELETE, cleared objects
+        # and the LogEntry INSERT.
+        with self.assertNumQueries(7):
+            self.related.related.add(self.obj)
+            self.related.related.clear()
         self.assertEqual(LogEntry.objects.count(), self.base_log_entry_count + 2)
 
     def test_additional_data(self):
@@ -495,24 +539,37 @@ class ManyRelatedModelTest(TestCase):
         self.assertEqual(len(entries), 1)
 
 
+class _MiddlewareTestException(Exception):
+    pass
+
+
 class MiddlewareTest(TestCase):
     """
     Test the middleware responsible for connecting and disconnecting the signals used in automatic logging.
     """
 
-    def setUp(self):
-        self.get_response_mock = mock.Mock()
-        self.response_mock = mock.Mock()
-        self.middleware = AuditlogMiddleware(get_response=self.get_response_mock)
-        self.factory = RequestFactory()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.middleware = AuditlogMiddleware()
+        cls.factory = RequestFactory()
+        cls.request = cls.factory.get("/")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="test", email="test@example.com", password="top_secret"
         )
 
+    def setUp(self):
+        self.get_response_mock = mock.Mock()
+        self.response_sentinel = object()
+        self.middleware.get_response = self.get_response_mock
+
     def side_effect(self, assertion):
         def inner(request):
             assertion()
-            return self.response_mock
+            return self.response_sentinel
 
         return inner
 
@@ -524,40 +581,38 @@ class MiddlewareTest(TestCase):
 
     def test_request_anonymous(self):
         """No actor will be logged when a user is not logged in."""
-        request = self.factory.get("/")
+        request = copy.copy(self.request)
         request.user = AnonymousUser()
 
         self.get_response_mock.side_effect = self.side_effect(self.assert_has_listeners)
 
         response = self.middleware(request)
 
-        self.assertIs(response, self.response_mock)
+        self.assertIs(response, self.response_sentinel)
         self.get_response_mock.assert_called_once_with(request)
         self.assert_no_listeners()
 
     def test_request(self):
         """The actor will be logged when a user is logged in."""
-        request = self.factory.get("/")
+        request = copy.copy(self.request)
         request.user = self.user
 
         self.get_response_mock.side_effect = self.side_effect(self.assert_has_listeners)
 
         response = self.middleware(request)
 
-        self.assertIs(response, self.response_mock)
+        self.assertIs(response, self.response_sentinel)
         self.get_response_mock.assert_called_once_with(request)
         self.assert_no_listeners()
 
     def test_exception(self):
         """The signal will be disconnected when an exception is raised."""
-        request = self.factory.get("/")
+        request = copy.copy(self.request)
         request.user = self.user
 
-        SomeException = type("SomeException", (Exception,), {})
+        self.get_response_mock.side_effect = _MiddlewareTestException
 
-        self.get_response_mock.side_effect = SomeException
-
-        with self.assertRaises(SomeException):
+        with self.assertRaises(_MiddlewareTestException):
             self.middleware(request)
 
         self.assert_no_listeners()
@@ -573,7 +628,7 @@ class MiddlewareTest(TestCase):
         with override_settings(AUDITLOG_DISABLE_REMOTE_ADDR=True):
             headers = {"HTTP_X_FORWARDED_FOR": "127.0.0.2"}
             request = self.factory.get("/", **headers)
-            remote_addr = self.middleware._get_remote_addr(request)
+            remote_addr = AuditlogMiddleware()._get_remote_addr(request)
             self.assertIsNone(remote_addr)
 
     def test_get_remote_addr(self):
@@ -666,7 +721,7 @@ class MiddlewareTest(TestCase):
         ]
         for user, actor, msg in params:
             with self.subTest(msg):
-                request = self.factory.get("/")
+                request = copy.copy(self.request)
                 request.user = user
 
                 self.assertEqual(self.middleware._get_actor(request), actor)
@@ -699,17 +754,21 @@ class SimpleIncludeModelTest(TestCase):
     def test_register_include_fields(self):
         sim = SimpleIncludeModel(label="Include model", text="Looong text")
         sim.save()
-        self.assertEqual(sim.history.count(), 1, msg="There is one log entry")
 
         # Change label, record
         sim.label = "Changed label"
         sim.save()
-        self.assertEqual(sim.history.count(), 2, msg="There are two log entries")
 
         # Change text, ignore
         sim.text = "Short text"
         sim.save()
+
         self.assertEqual(sim.history.count(), 2, msg="There are two log entries")
+        self.assertDictEqual(
+            sim.history.get(action=LogEntry.Action.UPDATE).changes,
+            {"label": ["Include model", "Changed label"]},
+            msg="Only the label change was logged",
+        )
 
 
 class SimpleExcludeModelTest(TestCase):
@@ -729,17 +788,21 @@ class SimpleExcludeModelTest(TestCase):
     def test_register_exclude_fields(self):
         sem = SimpleExcludeModel(label="Exclude model", text="Looong text")
         sem.save()
-        self.assertEqual(sem.history.count(), 1, msg="There is one log entry")
 
         # Change label, record it.
         sem.label = "Changed label"
         sem.save()
-        self.assertEqual(sem.history.count(), 2, msg="There are two log entries")
 
         # Change text, ignore it.
         sem.text = "Short text"
         sem.save()
+
         self.assertEqual(sem.history.count(), 2, msg="There are two log entries")
+        self.assertDictEqual(
+            sem.history.get(action=LogEntry.Action.UPDATE).changes,
+            {"label": ["Exclude model", "Changed label"]},
+            msg="Only the label change was logged",
+        )
 
 
 class SimpleMappingModelTest(TestCase):
@@ -750,23 +813,26 @@ class SimpleMappingModelTest(TestCase):
             sku="ASD301301A6", vtxt="2.1.5", not_mapped="Not mapped"
         )
         smm.save()
+        log_entry = smm.history.latest()
+        changes_dict = log_entry.changes_dict
+        changes_display_dict = log_entry.changes_display_dict
         self.assertEqual(
-            smm.history.latest().changes_dict["sku"][1],
+            changes_dict["sku"][1],
             "ASD301301A6",
             msg="The diff function retains 'sku' and can be retrieved.",
         )
         self.assertEqual(
-            smm.history.latest().changes_dict["not_mapped"][1],
+            changes_dict["not_mapped"][1],
             "Not mapped",
             msg="The diff function does not map 'not_mapped' and can be retrieved.",
         )
         self.assertEqual(
-            smm.history.latest().changes_display_dict["Product No."][1],
+            changes_display_dict["Product No."][1],
             "ASD301301A6",
             msg="The diff function maps 'sku' as 'Product No.' and can be retrieved.",
         )
         self.assertEqual(
-            smm.history.latest().changes_display_dict["Version"][1],
+            changes_display_dict["Version"][1],
             "2.1.5",
             msg=(
                 "The diff function maps 'vtxt' as 'Version' through verbose_name"
@@ -774,7 +840,7 @@ class SimpleMappingModelTest(TestCase):
             ),
         )
         self.assertEqual(
-            smm.history.latest().changes_display_dict["not mapped"][1],
+            changes_display_dict["not mapped"][1],
             "Not mapped",
             msg=(
                 "The diff function uses the django default verbose name for 'not_mapped'"
@@ -834,32 +900,23 @@ class DateTimeFieldModelTest(TestCase):
     """Tests if DateTimeField changes are recognised correctly"""
 
     utc_plus_one = django_timezone.get_fixed_timezone(datetime.timedelta(hours=1))
-    now = django_timezone.now()
-
-    def setUp(self):
-        super().setUp()
-        self._context = warnings.catch_warnings()
-        self._context.__enter__()
-        warnings.filterwarnings(
-            "ignore", message=".*naive datetime", category=RuntimeWarning
+    display_timestamp = datetime.datetime(2017, 1, 10, 15, 0, tzinfo=timezone.utc)
+    display_date = datetime.date(2017, 1, 10)
+    display_time = datetime.time(12, 0)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = django_timezone.now()
+        cls.dtm = DateTimeFieldModel.objects.create(
+            label="DateTimeField model",
+            timestamp=datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc),
+            date=datetime.date(2017, 1, 10),
+            time=datetime.time(12, 0),
+            naive_dt=cls.now,
         )
 
-    def tearDown(self):
-        self._context.__exit__()
-        super().tearDown()
-
     def test_model_with_same_time(self):
-        timestamp = datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.dtm
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
         # Change timestamp to same datetime and timezone
@@ -873,17 +930,7 @@ class DateTimeFieldModelTest(TestCase):
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
     def test_model_with_different_timezone(self):
-        timestamp = datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.dtm
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
         # Change timestamp to same datetime in another timezone
@@ -895,17 +942,7 @@ class DateTimeFieldModelTest(TestCase):
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
     def test_model_with_different_datetime(self):
-        timestamp = datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.dtm
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
         # Change timestamp to another datetime in the same timezone
@@ -917,17 +954,7 @@ class DateTimeFieldModelTest(TestCase):
         self.assertEqual(dtm.history.count(), 2, msg="There are two log entries")
 
     def test_model_with_different_date(self):
-        timestamp = datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.dtm
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
         # Change timestamp to another datetime in the same timezone
@@ -939,17 +966,7 @@ class DateTimeFieldModelTest(TestCase):
         self.assertEqual(dtm.history.count(), 2, msg="There are two log entries")
 
     def test_model_with_different_time(self):
-        timestamp = datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.dtm
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
         # Change timestamp to another datetime in the same timezone
@@ -961,17 +978,7 @@ class DateTimeFieldModelTest(TestCase):
         self.assertEqual(dtm.history.count(), 2, msg="There are two log entries")
 
     def test_model_with_different_time_and_timezone(self):
-        timestamp = datetime.datetime(2017, 1, 10, 12, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.dtm
         self.assertEqual(dtm.history.count(), 1, msg="There is one log entry")
 
         # Change timestamp to another datetime and another timezone
@@ -982,19 +989,20 @@ class DateTimeFieldModelTest(TestCase):
         # The time should have changed.
         self.assertEqual(dtm.history.count(), 2, msg="There are two log entries")
 
-    def test_changes_display_dict_datetime(self):
-        timestamp = datetime.datetime(2017, 1, 10, 15, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
+    def make_display_object(self, **kwargs):
+        kwargs.setdefault("naive_dt", self.now)
+        return DateTimeFieldModel.objects.create(
             label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
+            timestamp=self.display_timestamp,
+            date=self.display_date,
+            time=self.display_time,
+            **kwargs,
         )
-        dtm.save()
-        localized_timestamp = timestamp.astimezone(gettz(settings.TIME_ZONE))
+
+    def test_changes_display_dict_datetime(self):
+        dtm = self.make_display_object()
+        local_tz = gettz(settings.TIME_ZONE)
+        localized_timestamp = self.display_timestamp.astimezone(local_tz)
         self.assertEqual(
             dtm.history.latest().changes_display_dict["timestamp"][1],
             dateformat.format(localized_timestamp, settings.DATETIME_FORMAT),
@@ -1006,7 +1014,7 @@ class DateTimeFieldModelTest(TestCase):
         timestamp = django_timezone.now()
         dtm.timestamp = timestamp
         dtm.save()
-        localized_timestamp = timestamp.astimezone(gettz(settings.TIME_ZONE))
+        localized_timestamp = timestamp.astimezone(local_tz)
         self.assertEqual(
             dtm.history.latest().changes_display_dict["timestamp"][1],
             dateformat.format(localized_timestamp, settings.DATETIME_FORMAT),
@@ -1016,32 +1024,26 @@ class DateTimeFieldModelTest(TestCase):
             ),
         )
 
-        # Change USE_L10N = True
-        with self.settings(USE_L10N=True, LANGUAGE_CODE="en-GB"):
-            self.assertEqual(
-                dtm.history.latest().changes_display_dict["timestamp"][1],
-                formats.localize(localized_timestamp),
-                msg=(
-                    "The datetime should be formatted according to Django's settings for"
-                    " USE_L10N is True with a different LANGUAGE_CODE."
-                ),
-            )
+    @override_settings(USE_L10N=True, LANGUAGE_CODE="en-GB")
+    def test_changes_display_dict_datetime_l10n(self):
+        dtm = self.make_display_object()
+        localized_timestamp = self.display_timestamp.astimezone(
+            gettz(settings.TIME_ZONE)
+        )
+        self.assertEqual(
+            dtm.history.latest().changes_display_dict["timestamp"][1],
+            formats.localize(localized_timestamp),
+            msg=(
+                "The datetime should be formatted according to Django's settings for"
+                " USE_L10N is True with a different LANGUAGE_CODE."
+            ),
+        )
 
     def test_changes_display_dict_date(self):
-        timestamp = datetime.datetime(2017, 1, 10, 15, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.make_display_object()
         self.assertEqual(
             dtm.history.latest().changes_display_dict["date"][1],
-            dateformat.format(date, settings.DATE_FORMAT),
+            dateformat.format(self.display_date, settings.DATE_FORMAT),
             msg=(
                 "The date should be formatted according to Django's settings for"
                 " DATE_FORMAT unless USE_L10N is True."
@@ -1059,32 +1061,23 @@ class DateTimeFieldModelTest(TestCase):
             ),
         )
 
-        # Change USE_L10N = True
-        with self.settings(USE_L10N=True, LANGUAGE_CODE="en-GB"):
-            self.assertEqual(
-                dtm.history.latest().changes_display_dict["date"][1],
-                formats.localize(date),
-                msg=(
-                    "The date should be formatted according to Django's settings for"
-                    " USE_L10N is True with a different LANGUAGE_CODE."
-                ),
-            )
+    @override_settings(USE_L10N=True, LANGUAGE_CODE="en-GB")
+    def test_changes_display_dict_date_l10n(self):
+        dtm = self.make_display_object()
+        self.assertEqual(
+            dtm.history.latest().changes_display_dict["date"][1],
+            formats.localize(self.display_date),
+            msg=(
+                "The date should be formatted according to Django's settings for"
+                " USE_L10N is True with a different LANGUAGE_CODE."
+            ),
+        )
 
     def test_changes_display_dict_time(self):
-        timestamp = datetime.datetime(2017, 1, 10, 15, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.make_display_object()
         self.assertEqual(
             dtm.history.latest().changes_display_dict["time"][1],
-            dateformat.format(time, settings.TIME_FORMAT),
+            dateformat.format(self.display_time, settings.TIME_FORMAT),
             msg=(
                 "The time should be formatted according to Django's settings for"
                 " TIME_FORMAT unless USE_L10N is True."
@@ -1102,49 +1095,36 @@ class DateTimeFieldModelTest(TestCase):
             ),
         )
 
-        # Change USE_L10N = True
-        with self.settings(USE_L10N=True, LANGUAGE_CODE="en-GB"):
-            self.assertEqual(
-                dtm.history.latest().changes_display_dict["time"][1],
-                formats.localize(time),
-                msg=(
-                    "The time should be formatted according to Django's settings for"
-                    " USE_L10N is True with a different LANGUAGE_CODE."
-                ),
-            )
+    @override_settings(USE_L10N=True, LANGUAGE_CODE="en-GB")
+    def test_changes_display_dict_time_l10n(self):
+        dtm = self.make_display_object()
+        self.assertEqual(
+            dtm.history.latest().changes_display_dict["time"][1],
+            formats.localize(self.display_time),
+            msg=(
+                "The time should be formatted according to Django's settings for"
+                " USE_L10N is True with a different LANGUAGE_CODE."
+            ),
+        )
 
     def test_update_naive_dt(self):
-        timestamp = datetime.datetime(2017, 1, 10, 15, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=self.now,
-        )
-        dtm.save()
+        dtm = self.make_display_object()
 
         # Change with naive field doesnt raise error
         dtm.naive_dt = django_timezone.make_naive(
-            django_timezone.now(), timezone=timezone.utc
+            self.now + datetime.timedelta(seconds=1), timezone=timezone.utc
         )
-        dtm.save()
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", message=".*naive datetime", category=RuntimeWarning
+            )
+            dtm.save()
 
-    def test_datetime_field_functions_now(self):
-        timestamp = datetime.datetime(2017, 1, 10, 15, 0, tzinfo=timezone.utc)
-        date = datetime.date(2017, 1, 10)
-        time = datetime.time(12, 0)
+        history = dtm.history.get(action=LogEntry.Action.UPDATE)
+        self.assertIn("naive_dt", history.changes)
 
-        dtm = DateTimeFieldModel(
-            label="DateTimeField model",
-            timestamp=timestamp,
-            date=date,
-            time=time,
-            naive_dt=Now(),
-        )
-        dtm.save()
+    def test_datetime_field_functions_now(self):
+        dtm = self.make_display_object(naive_dt=Now())
         dtm.naive_dt = Now()
         self.assertEqual(dtm.naive_dt, Now())
         dtm.save()
@@ -1160,13 +1140,16 @@ class DateTimeFieldModelTest(TestCase):
 
 
 class UnregisterTest(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         auditlog.unregister(SimpleModel)
-        self.obj = SimpleModel.objects.create(text="No history")
+        # Re-register for future tests, even if the rest of setUpClass fails.
+        cls.addClassCleanup(auditlog.register, SimpleModel)
+        super().setUpClass()
 
-    def tearDown(self):
-        # Re-register for future tests
-        auditlog.register(SimpleModel)
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = SimpleModel.objects.create(text="No history")
 
     def test_unregister_create(self):
         """Creation is not logged after unregistering."""
@@ -1174,7 +1157,7 @@ class UnregisterTest(TestCase):
         obj = self.obj
 
         # Check for log entries
-        self.assertEqual(obj.history.count(), 0, msg="There are no log entries")
+        self.assertFalse(obj.history.exists(), msg="There are no log entries")
 
     def test_unregister_update(self):
         """Updates are not logged after unregistering."""
@@ -1186,7 +1169,7 @@ class UnregisterTest(TestCase):
         obj.save()
 
         # Check for log entries
-        self.assertEqual(obj.history.count(), 0, msg="There are no log entries")
+        self.assertFalse(obj.history.exists(), msg="There are no log entries")
 
     def test_unregister_delete(self):
         """Deletion is not logged after unregistering."""
@@ -1197,7 +1180,7 @@ class UnregisterTest(TestCase):
         obj.delete()
 
         # Check for log entries
-        self.assertEqual(LogEntry.objects.count(), 0, msg="There are no log entries")
+        self.assertFalse(LogEntry.objects.exists(), msg="There are no log entries")
 
     def test_manual_logging(self):
         obj = self.obj
@@ -1235,17 +1218,17 @@ class RegisterModelSettingsTest(TestCase):
         self.assertEqual(len(self.test_auditlog._get_exclude_models(())), 2)
 
         # Exclude just one model
-        self.assertTrue(
-            SimpleExcludeModel
-            in self.test_auditlog._get_exclude_models(
+        self.assertIn(
+            SimpleExcludeModel,
+            self.test_auditlog._get_exclude_models(
                 ("auditlog_tests.SimpleExcludeModel",)
-            )
+            ),
         )
 
         # Exclude all model of an app
-        self.assertTrue(
-            SimpleExcludeModel
-            in self.test_auditlog._get_exclude_models(("auditlog_tests",))
+        self.assertIn(
+            SimpleExcludeModel,
+            self.test_auditlog._get_exclude_models(("auditlog_tests",)),
         )
 
     def test_register_models_no_models(self):
@@ -1486,8 +1469,9 @@ class RegisterModelSettingsTest(TestCase):
 
 
 class ChoicesFieldModelTest(TestCase):
-    def setUp(self):
-        self.obj = ChoicesFieldModel.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = ChoicesFieldModel.objects.create(
             status=ChoicesFieldModel.RED,
             multiplechoice=[
                 ChoicesFieldModel.RED,
@@ -1528,16 +1512,18 @@ class ChoicesFieldModelTest(TestCase):
         obj = SimpleModel()
         obj.save()
         history = obj.history.get()
-        assert "related_models" in history.changes_display_dict
+        self.assertIn("related_models", history.changes_display_dict)
 
 
 class CharFieldTextFieldModelTest(TestCase):
-    def setUp(self):
-        self.PLACEHOLDER_LONGCHAR = "s" * 255
-        self.PLACEHOLDER_LONGTEXTFIELD = "s" * 1000
-        self.obj = CharfieldTextfieldModel.objects.create(
-            longchar=self.PLACEHOLDER_LONGCHAR,
-            longtextfield=self.PLACEHOLDER_LONGTEXTFIELD,
+    PLACEHOLDER_LONGCHAR = "s" * 255
+    PLACEHOLDER_LONGTEXTFIELD = "s" * 1000
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = CharfieldTextfieldModel.objects.create(
+            longchar=cls.PLACEHOLDER_LONGCHAR,
+            longtextfield=cls.PLACEHOLDER_LONGTEXTFIELD,
         )
 
     def test_changes_display_dict_longchar(self):
@@ -1605,8 +1591,9 @@ class CharFieldTextFieldModelTest(TestCase):
 class PostgresArrayFieldModelTest(TestCase):
     databases = "__all__"
 
-    def setUp(self):
-        self.obj = PostgresArrayFieldModel.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = PostgresArrayFieldModel.objects.create(
             arrayfield=[PostgresArrayFieldModel.RED, PostgresArrayFieldModel.GREEN],
         )
 
@@ -1644,28 +1631,60 @@ class PostgresArrayFieldModelTest(TestCase):
 
 
 class AdminPanelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.site = AdminSite()
+        cls.admin = LogEntryAdmin(LogEntry, cls.site)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="test_admin", is_staff=True, is_superuser=True, is_active=True
         )
-        self.site = AdminSite()
-        self.admin = LogEntryAdmin(LogEntry, self.site)
         with freezegun.freeze_time("2022-08-01 12:00:00Z"):
-            self.obj = SimpleModel.objects.create(text="For admin logentry test")
+            cls.obj = SimpleModel.objects.create(text="For admin logentry test")
+
+    def get_admin_view(self, path):
+        """Call the admin view resolved for ``path`` without the middleware stack."""
+        request = RequestFactory().get(path)
+        request.resolver_match = resolve(path)
+        request.user = self.user
+        response = request.resolver_match.func(
+            request, *request.resolver_match.args, **request.resolver_match.kwargs
+        )
+        return response.render()
 
     def test_auditlog_admin(self):
-        self.client.force_login(self.user)
         log_pk = self.obj.history.latest().pk
-        res = self.client.get("/admin/auditlog/logentry/")
-        self.assertEqual(res.status_code, 200)
-        res = self.client.get("/admin/auditlog/logentry/add/")
-        self.assertEqual(res.status_code, 403)
-        res = self.client.get(f"/admin/auditlog/logentry/{log_pk}/", follow=True)
-        self.assertEqual(res.status_code, 200)
-        res = self.client.get(f"/admin/auditlog/logentry/{log_pk}/delete/")
-        self.assertEqual(res.status_code, 403)
-        res = self.client.get(f"/admin/auditlog/logentry/{log_pk}/history/")
-        self.assertEqual(res.status_code, 200)
+        for path in (
+            reverse("admin:auditlog_logentry_changelist"),
+            reverse("admin:auditlog_logentry_change", args=[log_pk]),
+            reverse("admin:auditlog_logentry_history", args=[log_pk]),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(self.get_admin_view(path).status_code, 200)
+        # Denied views raise PermissionDenied, which needs the full handler.
+        self.client.force_login(self.user)
+        for path in (
+            reverse("admin:auditlog_logentry_add"),
+            reverse("admin:auditlog_logentry_delete", args=[log_pk]),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(path).status_code, 403)
+
+    def test_get_queryset_selects_related(self):
+        with set_actor(self.user):
+            self.obj.text = "Changed by an actor"
+            self.obj.save()
+        request = RequestFactory().get("/admin/auditlog/logentry/")
+        request.user = self.user
+        log_entry = self.admin.get_queryset(request).get(
+            pk=self.obj.history.latest().pk
+        )
+        with self.assertNumQueries(0):
+            self.admin.resource_url(log_entry)
+            self.admin.user_url(log_entry)
 
     def test_created_timezone(self):
         log_entry = self.obj.history.latest()
@@ -1692,7 +1711,6 @@ class AdminPanelTest(TestCase):
             )
 
     def test_cid(self):
-        self.client.force_login(self.user)
         expected_response = (
             '<a href="/admin/auditlog/logentry/?cid=123" '
             'title="Click to filter by records with this correlation id">123</a>'
@@ -1702,9 +1720,9 @@ class AdminPanelTest(TestCase):
         log_entry.cid = "123"
         log_entry.save()
 
-        res = self.client.get("/admin/auditlog/logentry/")
+        res = self.get_admin_view(reverse("admin:auditlog_logentry_changelist"))
         self.assertEqual(res.status_code, 200)
-        self.assertIn(expected_response, res.rendered_content)
+        self.assertIn(expected_response, res.content.decode())
 
     def test_has_delete_permission(self):
         log = self.obj.history.latest()
@@ -1725,17 +1743,19 @@ class AdminPanelTest(TestCase):
 
 
 class DiffMsgTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # The logged object doesn't affect anything; share one across tests.
+        with disable_auditlog():
+            cls.obj = SimpleModel.objects.create()
+
     def setUp(self):
         super().setUp()
         self.site = AdminSite()
         self.admin = LogEntryAdmin(LogEntry, self.site)
 
     def _create_log_entry(self, action, changes):
-        return LogEntry.objects.log_create(
-            SimpleModel.objects.create(),  # doesn't affect anything
-            action=action,
-            changes=changes,
-        )
+        return LogEntry.objects.log_create(self.obj, action=action, changes=changes)
 
     def test_change_msg_create_when_exceeds_max_len(self):
         log_entry = self._create_log_entry(
@@ -1898,37 +1918,57 @@ class DiffMsgTest(TestCase):
 class NoDeleteHistoryTest(TestCase):
     def test_delete_related(self):
         instance = SimpleModel.objects.create(integer=1)
-        assert LogEntry.objects.all().count() == 1
         instance.integer = 2
         instance.save()
-        assert LogEntry.objects.all().count() == 2
+        entries = LogEntry.objects.order_by("id").values_list("action", flat=True)
+        self.assertEqual(
+            list(entries), [LogEntry.Action.CREATE, LogEntry.Action.UPDATE]
+        )
 
         instance.delete()
-        entries = LogEntry.objects.order_by("id")
 
         # The "DELETE" record is always retained
-        assert LogEntry.objects.all().count() == 1
-        assert entries.first().action == LogEntry.Action.DELETE
+        self.assertEqual(list(entries.all()), [LogEntry.Action.DELETE])
+
+    def test_delete_related_with_existing_entries(self):
+        with disable_auditlog():
+            instance = SimpleModel.objects.create(integer=1)
+        content_type = ContentType.objects.get_for_model(SimpleModel)
+        LogEntry.objects.bulk_create(
+            LogEntry(
+                content_type=content_type,
+                object_pk=str(instance.pk),
+                object_id=instance.pk,
+                object_repr=str(instance),
+                action=action,
+            )
+            for action in (LogEntry.Action.CREATE, LogEntry.Action.UPDATE)
+        )
+
+        instance.delete()
+
+        self.assertEqual(
+            list(LogEntry.objects.values_list("action", flat=True)),
+            [LogEntry.Action.DELETE],
+        )
 
     def test_no_delete_related(self):
         instance = NoDeleteHistoryModel.objects.create(integer=1)
-        self.assertEqual(LogEntry.objects.all().count(), 1)
         instance.integer = 2
         instance.save()
-        self.assertEqual(LogEntry.objects.all().count(), 2)
-
         instance.delete()
-        entries = LogEntry.objects.order_by("id")
-        self.assertEqual(entries.count(), 3)
+
+        entries = LogEntry.objects.order_by("id").values_list("action", flat=True)
         self.assertEqual(
-            list(entries.values_list("action", flat=True)),
+            list(entries),
             [LogEntry.Action.CREATE, LogEntry.Action.UPDATE, LogEntry.Action.DELETE],
         )
 
 
 class JSONModelTest(TestCase):
-    def setUp(self):
-        self.obj = JSONModel.objects.create()
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = JSONModel.objects.create()
 
     def test_update(self):
         """Changes on a JSONField are logged correctly."""
@@ -1999,13 +2039,10 @@ class ModelInstanceDiffTest(TestCase):
 
         # This tests that track_field() does indeed ignore related fields.
 
-        # a model without reverse relations
-        simple1 = SimpleModel()
-        simple1.save()
-
-        # a model with reverse relations
-        simple2 = SimpleModel()
-        simple2.save()
+        # simple1 is a model without reverse relations, simple2 one with them.
+        simple1, simple2 = SimpleModel.objects.bulk_create(
+            [SimpleModel(), SimpleModel()]
+        )
         related = RelatedModel(related=simple2, one_to_one=simple2)
         related.save()
 
@@ -2422,7 +2459,10 @@ class TestModelSerialization(TestCase):
         )
         self.assertDictEqual(
             log.changes_dict,
-            {"this": ["None", "this should be there"], "id": ["None", "1"]},
+            {
+                "this": ["None", "this should be there"],
+                "id": ["None", str(instance.pk)],
+            },
         )
 
     def test_serialize_related(self):
@@ -2513,7 +2553,7 @@ class TestAccessLog(TestCase):
 
         log_entry = qs.latest()
         self.assertEqual(int(log_entry.object_pk), self.obj.pk)
-        self.assertEqual(log_entry.actor, self.user)
+        self.assertEqual(log_entry.actor_id, self.user.pk)
         self.assertEqual(log_entry.content_type, content_type)
         self.assertEqual(
             log_entry.action, LogEntry.Action.ACCESS, msg="Action is 'ACCESS'"
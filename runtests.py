@@ -1,15 +1,29 @@
 #!/usr/bin/env python
+import argparse
 import os
 import sys
 
 import django
 from django.conf import settings
+from django.test.runner import get_max_test_processes
 from django.test.utils import get_runner
 
 if __name__ == "__main__":
     os.environ["DJANGO_SETTINGS_MODULE"] = "auditlog_tests.test_settings"
     django.setup()
     TestRunner = get_runner(settings)
-    test_runner = TestRunner()
-    failures = test_runner.run_tests(["auditlog_tests"])
+    parser = argparse.ArgumentParser()
+    parser.add_argument("test_labels", nargs="*", default=["auditlog_tests"])
+    parser.add_argument("-v", "--verbosity", type=int, choices=[0, 1, 2, 3], default=1)
+    parser.add_argument(
+        "--noinput", "--no-input", action="store_false", dest="interactive"
+    )
+    # Expose the runner's own options, e.g. --keepdb, --parallel and -k.
+    TestRunner.add_arguments(parser)
+    options = vars(parser.parse_args())
+    test_labels = options.pop("test_labels")
+    if options["parallel"] == "auto":
+        options["parallel"] = get_max_test_processes()
+    test_runner = TestRunner(**options)
+    failures = test_runner.run_tests(test_labels)
     sys.exit(bool(failures))